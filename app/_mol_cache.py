@@ -0,0 +1,27 @@
+"""
+Shared SMILES canonicalisation for the Streamlit app.
+
+Different spellings of the same molecule (atom order, aromatic vs. Kekulé
+form, ...) should hit the same cache entries on every page.  ``canon``
+normalises user input to RDKit's canonical SMILES and memoises the result,
+so each distinct input string is parsed only once per process.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from rdkit import Chem
+
+
+@lru_cache(maxsize=1024)
+def canon(smiles: str) -> str:
+    """Return the canonical form of ``smiles``.
+
+    Strings RDKit cannot parse are returned unchanged so that the analysis
+    routines can report the error themselves.
+    """
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        return smiles
+    return Chem.MolToSmiles(mol)
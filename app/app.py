@@ -21,30 +21,169 @@ supporting fresh data collection when possible.
 
 from __future__ import annotations
 
+import io
 import os
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import pandas as pd
 import streamlit as st
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from rdkit_analysis import analyse_smiles
-from generate_derivatives import propose_derivatives
-from llm_integration import translate, summarise, chat_completion  # new LLM helpers
+# RDKit, the scraper and the LLM helpers are imported lazily inside the pages
+# that use them, so browsing the product catalogue does not pay for loading
+# RDKit on cold start.  Python caches the modules after the first import.
 
-# Optional import; scraping may not work if network access is blocked
-try:
-    from scrape_czech_cbd import crawl_urls
-except Exception:
-    crawl_urls = None  # type: ignore
+
+# Columns written by the scraper plus the optional ``smiles`` column.  All of
+# them are free text, so declaring their dtype spares pandas an inference pass
+# over the whole file.  Columns missing from a given CSV are ignored.
+_TEXT_COLUMNS = ("name", "url", "price", "description", "composition", "cannabinoids", "smiles")
+
+# Number of catalogue rows rendered on the overview page by default.
+_PREVIEW_ROWS = 1000
+
+
+def _read_csv(data: bytes) -> pd.DataFrame:
+    """Parse CSV bytes, preferring pandas' multi-threaded pyarrow engine."""
+    dtype = {col: "string" for col in _TEXT_COLUMNS}
+    try:
+        df = pd.read_csv(io.BytesIO(data), dtype=dtype, engine="pyarrow", dtype_backend="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow missing or unable to handle the file; use the default parser
+        df = pd.read_csv(io.BytesIO(data), dtype=dtype)
+    if "smiles" in df.columns:
+        # Few distinct structures repeat across many products; as a categorical
+        # the unique SMILES are available without rescanning the column.
+        df["smiles"] = df["smiles"].astype("category")
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _read_products_csv(csv_path: str, mtime: float) -> pd.DataFrame:
+    """Parse the products CSV; ``mtime`` keys the cache so edits invalidate it.
+
+    A typed Parquet copy is written next to the CSV so later loads (e.g.
+    after an app restart) can skip CSV parsing altogether.
+    """
+    df = _read_csv(Path(csv_path).read_bytes())
+    try:
+        df.to_parquet(Path(csv_path).with_suffix(".parquet"), compression="zstd")
+    except Exception:
+        # pyarrow unavailable or directory not writable; the CSV still works
+        pass
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _read_products_parquet(parquet_path: str, mtime: float) -> pd.DataFrame:
+    """Load the Parquet copy of the products table written by ``_read_products_csv``."""
+    return pd.read_parquet(parquet_path)
+
+
+@st.cache_data(show_spinner=False)
+def _read_uploaded(data: bytes) -> pd.DataFrame:
+    """Parse an uploaded CSV, cached on its raw bytes."""
+    return _read_csv(data)
+
+
+# Source of the analysis routines; its modification time keys the on-disk
+# analysis cache, which otherwise only notices changes to this file.
+_ANALYSIS_SOURCE = Path(__file__).resolve().parent.parent / "rdkit_analysis.py"
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _cached_analyse(smi: str, image_dir: str, source_mtime: float):
+    """Run ``analyse_smiles`` once per SMILES/image directory pair.
+
+    Results are persisted to Streamlit's on-disk cache, so descriptor
+    calculation and depiction rendering are skipped for molecules analysed
+    in earlier sessions as well.  ``source_mtime`` is the modification time
+    of ``rdkit_analysis.py``, so editing the analysis invalidates old
+    entries.
+    """
+    from rdkit_analysis import analyse_smiles
+
+    return analyse_smiles(smi, image_dir=image_dir)
+
+
+@st.cache_data(show_spinner=False)
+def _image_data(path: str, mtime: float) -> Union[bytes, str]:
+    """Read a depiction from disk once; ``mtime`` keys the cache.
+
+    SVG depictions are returned as text, which is what ``st.image``
+    expects for vector images.
+    """
+    if path.endswith(".svg"):
+        return Path(path).read_text(encoding="utf-8")
+    return Path(path).read_bytes()
+
+
+@dataclass
+class _ScrapeJob:
+    """Progress of a scraper run executing in a background thread."""
+
+    urls: List[str]
+    done: int = 0
+    finished: bool = False
+    error: Optional[str] = None
+
+
+def _run_scrape(job: _ScrapeJob, csv_path: str) -> None:
+    """Scrape ``job.urls`` concurrently and save the results to CSV.
+
+    Runs in a worker thread, so it only updates ``job`` and never touches
+    Streamlit APIs; the UI polls the job from ``_scrape_status``, and
+    ``job.done`` counts the pages ``scrape_products`` has handled so far.
+    """
+    try:
+        # Optional dependency; scraping may not work if network access is blocked
+        from scrape_czech_cbd import scrape_products
+
+        def _page_done() -> None:
+            job.done += 1
+
+        rows = [p.to_dict() for p in scrape_products(job.urls, progress=_page_done)]
+        if not rows:
+            raise RuntimeError("no products were scraped")
+        pd.DataFrame(rows).to_csv(csv_path, index=False)
+    except Exception as e:
+        job.error = str(e)
+    finally:
+        job.finished = True
+
+
+@st.fragment(run_every=1.0)
+def _scrape_status() -> None:
+    """Poll the background scraper and report its progress."""
+    job: Optional[_ScrapeJob] = st.session_state.get("scrape_job")
+    if job is None:
+        return
+    if not job.finished:
+        st.progress(
+            job.done / len(job.urls),
+            text=f"Scraping Czech‑CBD... {job.done}/{len(job.urls)} pages (network access required)",
+        )
+    elif job.error:
+        st.error(f"Scraping failed: {job.error}")
+    else:
+        # Rerun the whole app so the freshly written products.csv is loaded
+        del st.session_state["scrape_job"]
+        st.rerun()
 
 
 def load_products(csv_path: str | os.PathLike) -> Optional[pd.DataFrame]:
     """Load product data from a CSV file if it exists.
 
+    The parsed DataFrame is cached across Streamlit reruns and keyed on the
+    file's path and modification time, so the CSV is only re-read when it
+    changes on disk.  A sibling ``.parquet`` file that is at least as new as
+    the CSV is preferred, as it loads much faster.
+
     Parameters
     ----------
     csv_path: str or Path
@@ -56,7 +195,19 @@ def load_products(csv_path: str | os.PathLike) -> Optional[pd.DataFrame]:
         Loaded data or None if the file does not exist.
     """
     try:
-        return pd.read_csv(csv_path)
+        mtime = os.path.getmtime(csv_path)
+    except OSError:
+        return None
+    parquet_path = Path(csv_path).with_suffix(".parquet")
+    try:
+        parquet_mtime = os.path.getmtime(parquet_path)
+        if parquet_mtime >= mtime:
+            return _read_products_parquet(str(parquet_path), parquet_mtime)
+    except Exception:
+        # Missing or unreadable Parquet copy; fall back to the CSV
+        pass
+    try:
+        return _read_products_csv(str(csv_path), mtime)
     except Exception:
         return None
 
@@ -100,29 +251,39 @@ def main() -> None:
             "Upload products.csv", type=["csv"], key="upload_csv"
         )
         if uploaded is not None:
-            products_df = pd.read_csv(uploaded)
-        elif crawl_urls is not None:
-            if st.sidebar.button("Run scraper (may take a while)"):
-                st.sidebar.info(
-                    "Scraping Czech‑CBD... please be patient (network access required)"
-                )
-                try:
+            products_df = _read_uploaded(uploaded.getvalue())
+        else:
+            job = st.session_state.get("scrape_job")
+            if job is None or job.finished:
+                if st.sidebar.button("Run scraper (may take a while)"):
                     # Example list of URLs; in practice you might crawl categories
                     seed_urls: List[str] = [
                         "https://www.czech-cbd.cz/10-oh-hhc-brownies",
                         "https://www.czech-cbd.cz/thcv-honey",
                     ]
-                    products_df = crawl_urls(seed_urls)
-                    products_df.to_csv(products_csv, index=False)
-                    st.sidebar.success("Scraping complete.  Data saved to products.csv.")
-                except Exception as e:
-                    st.sidebar.error(f"Scraping failed: {e}")
+                    job = _ScrapeJob(urls=seed_urls)
+                    st.session_state["scrape_job"] = job
+                    # Scrape off the script thread so the UI stays responsive
+                    threading.Thread(
+                        target=_run_scrape, args=(job, str(products_csv)), daemon=True
+                    ).start()
+            if job is not None:
+                with st.sidebar:
+                    _scrape_status()
 
     # Upload molecules from user input or selection
     if choice == "Product Overview":
         st.header("Product Catalogue")
         if products_df is not None and not products_df.empty:
-            st.dataframe(products_df)
+            # Only ship the first rows to the browser unless asked otherwise;
+            # serialising a large catalogue on every rerun dominates render time.
+            if len(products_df) > _PREVIEW_ROWS and not st.checkbox(
+                f"Show full table ({len(products_df)} rows)", value=False
+            ):
+                st.dataframe(products_df.head(_PREVIEW_ROWS))
+                st.caption(f"Showing the first {_PREVIEW_ROWS} of {len(products_df)} products.")
+            else:
+                st.dataframe(products_df)
             st.info(
                 "Select a row from the above table to analyse its molecule in the "
                 "next page."
@@ -143,7 +304,9 @@ def main() -> None:
             st.subheader("Or pick from products")
             # Provide selection of molecules for which we know SMILES (optional column)
             if "smiles" in products_df.columns:
-                smi_options = products_df["smiles"].dropna().unique().tolist()
+                # ``smiles`` is categorical (see ``_read_csv``), so the distinct
+                # values come straight from its categories.
+                smi_options = products_df["smiles"].cat.categories.tolist()
                 if smi_options:
                     selected_smiles = st.selectbox("Select SMILES", options=smi_options)
         # Determine which SMILES to analyse
@@ -154,26 +317,46 @@ def main() -> None:
             input_smiles = selected_smiles
         if input_smiles:
             try:
-                result = analyse_smiles(input_smiles, image_dir=str(repo_root / "molecule_images"))
+                # Reruns triggered by unrelated widgets reuse the last result
+                # without even hashing the inputs for the cache lookup.
+                if st.session_state.get("last_smi") != input_smiles:
+                    from _mol_cache import canon
+
+                    # Canonical SMILES give equivalent inputs a shared cache key
+                    st.session_state["last_result"] = _cached_analyse(
+                        canon(input_smiles),
+                        str(repo_root / "molecule_images"),
+                        os.path.getmtime(_ANALYSIS_SOURCE),
+                    )
+                    st.session_state["last_smi"] = input_smiles
+                result = st.session_state["last_result"]
+                if result.image_path and not os.path.exists(result.image_path):
+                    # The depiction was deleted after the result was cached;
+                    # render it again so the cached entry points at a file
+                    from rdkit_analysis import analyse_smiles
+
+                    result = analyse_smiles(
+                        result.smiles, image_dir=os.path.dirname(result.image_path)
+                    )
+                    st.session_state["last_result"] = result
                 st.success("Molecule analysed successfully.")
                 # Display 2D depiction
-                if result.image_path and os.path.exists(result.image_path):
-                    st.image(result.image_path, caption=f"Structure of {input_smiles}")
+                if result.image_path:
+                    st.image(
+                        _image_data(result.image_path, os.path.getmtime(result.image_path)),
+                        caption=f"Structure of {input_smiles}",
+                    )
                 # Display descriptors
                 st.subheader("Physicochemical descriptors")
-                desc_df = pd.DataFrame(result.descriptors, index=[0]).T
-                desc_df.columns = ["Value"]
-                st.table(desc_df)
+                st.table({"Value": result.descriptors})
                 # Lipinski
                 st.subheader("Lipinski rule of five")
-                lip_df = pd.DataFrame(result.lipinski_violations, index=["Pass"])
-                st.table(lip_df)
+                st.table({"Pass": result.lipinski_violations})
                 st.markdown(f"**Passes all rules:** {result.lipinski_pass}")
                 # QED and ADMET
                 st.subheader("Drug‑likeness and heuristic ADMET")
                 st.markdown(f"**QED score:** {result.qed_score:.3f}")
-                admet_df = pd.DataFrame(result.admet_predictions, index=["Prediction"]).T
-                st.table(admet_df)
+                st.table({"Prediction": result.admet_predictions})
                 st.info(
                     "These ADMET predictions are heuristic and based on simple rules. "
                     "They should not be used for clinical or regulatory decisions."
@@ -197,16 +380,30 @@ def main() -> None:
             submit_deriv = st.form_submit_button("Generate derivatives")
         if submit_deriv and smi_deriv:
             try:
-                derivatives = propose_derivatives(smi_deriv.strip())
+                smi_parent = smi_deriv.strip()
+                if st.session_state.get("last_deriv_smi") != smi_parent:
+                    from _mol_cache import canon
+                    from generate_derivatives import propose_derivatives
+
+                    st.session_state["last_derivatives"] = propose_derivatives(canon(smi_parent))
+                    st.session_state["last_deriv_smi"] = smi_parent
+                derivatives = st.session_state["last_derivatives"]
                 st.success(f"Generated {len(derivatives)} derivative(s)")
-                for smi in derivatives:
-                    st.markdown(f"- {smi}")
+                # One element for the whole list instead of one per derivative
+                st.markdown("\n".join(f"- {smi}" for smi in derivatives))
             except Exception as e:
                 st.error(f"Failed to generate derivatives: {e}")
         else:
             st.info("Enter a SMILES string above and click Generate derivatives.")
 
     elif choice == "LLM Tools":
+        from czech_cbd_analysis.llm_integration import (
+            chat_completion_stream,
+            summarise,
+            translate,
+            translate_and_summarise,
+        )
+
         st.header("LLM Tools: Translation, Summarisation and Q&A")
         st.markdown(
             "Use large language models to translate Czech text to English, summarise long descriptions or ask questions about cannabinoids.  Enter your API key below to authenticate.  Note that all responses are generated by AI and should be verified against reliable sources."
@@ -218,7 +415,7 @@ def main() -> None:
             "Input text", 
             help="Paste Czech product descriptions or scientific text here for translation or summarisation."
         )
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         translation_result = None
         summary_result = None
         if col1.button("Translate to English"):
@@ -241,6 +438,18 @@ def main() -> None:
                     summary_result = summarise(input_text.strip(), api_key=api_key)
                 except Exception as e:
                     st.error(f"Summarisation failed: {e}")
+        if col3.button("Translate + Summarise"):
+            if not api_key:
+                st.error("Please enter an API key.")
+            elif not input_text.strip():
+                st.error("Please provide text to translate and summarise.")
+            else:
+                try:
+                    translation_result, summary_result = translate_and_summarise(
+                        input_text.strip(), api_key=api_key
+                    )
+                except Exception as e:
+                    st.error(f"Translation and summarisation failed: {e}")
         if translation_result:
             st.subheader("Translation")
             st.write(translation_result)
@@ -273,9 +482,11 @@ def main() -> None:
                         },
                         {"role": "user", "content": question.strip()},
                     ]
-                    answer = chat_completion(messages, api_key=api_key, model="gpt-oss-120b")
                     st.subheader("Answer")
-                    st.write(answer)
+                    # Render tokens as they arrive rather than waiting for the full reply
+                    st.write_stream(
+                        chat_completion_stream(messages, api_key=api_key, model="gpt-oss-120b")
+                    )
                 except Exception as e:
                     st.error(f"LLM query failed: {e}")
 
@@ -6,8 +6,9 @@ This module defines helper functions for interacting with the e INFRA CZ AI
 platform.  These helpers wrap HTTP requests to the OpenAI‑compatible API provided
 by https://chat.ai.e-infra.cz.  Functions include generic chat completions,
 translation, summarisation and embedding utilities.  All functions take an
-explicit API key and avoid using global state.  Network errors and HTTP
-status codes are propagated to the caller.
+explicit API key; the only shared state is a pooled ``requests.Session`` that
+keeps connections alive between calls.  Network errors and HTTP status codes
+are propagated to the caller.
 
 The module is designed for testability: each function delegates the actual
 HTTP request to a private `_post` helper which can be patched during
@@ -20,20 +21,79 @@ testing.  Example usage:
     summary = summarise("This is a long article...", api_key=api_key)
 
 Note that these utilities are synchronous and may block; consider running
-them in a background thread if integrating into a web application.
+them in a background thread if integrating into a web application.  When the
+optional ``httpx`` package is installed, ``async`` variants
+(``achat_completion``, ``atranslate``, ``asummarise`` and
+``atranslate_and_summarise``) are available for use inside an event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
+import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib3.util import Retry
+
+# orjson is an optional, much faster JSON codec; it matters for large
+# embedding payloads.  The standard library is used when it is missing.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+# httpx is only needed for the async helpers.
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore
 
 # Base URL for the OpenAI‑compatible API.  The default points to the
 # e‟INFRA CZ chat service; override via the LLM_API_BASE_URL environment
 # variable if needed (e.g., during testing).
 BASE_URL = os.getenv("LLM_API_BASE_URL", "https://chat.ai.e-infra.cz/api/")
 
+# Transient failures (rate limiting, gateway errors) are retried with
+# exponential backoff.  POST is not retried by urllib3 by default, so it is
+# allowed explicitly; once retries are exhausted the last response is
+# returned so that ``raise_for_status`` reports the HTTP error as before.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["POST"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared session so that consecutive calls (e.g. translate followed by
+# summarise) reuse the same keep-alive connection instead of paying a new
+# TCP/TLS handshake each time.  Authentication headers are set per request
+# because the API key is supplied by the caller.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# System prompts used by the task-specific helpers.
+_TRANSLATE_PROMPT = "You are an assistant that translates text to English. Translate the user message without adding new information."
+_SUMMARISE_PROMPT = "Summarise the following text in a concise and neutral manner."
+
+# Small in-memory LRU of translation/summary responses.  Streamlit reruns the
+# whole script on every widget change, which would otherwise resend identical
+# requests; repeated inputs are now served without a network round-trip.
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
 
 def _post(endpoint: str, payload: Dict[str, Any], api_key: str) -> Dict[str, Any]:
     """Internal helper to perform a POST request to the API.
@@ -57,9 +117,48 @@ def _post(endpoint: str, payload: Dict[str, Any], api_key: str) -> Dict[str, Any
         raise ValueError("An API key must be provided")
     url = BASE_URL.rstrip("/") + endpoint
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers, timeout=60)
+    response = _SESSION.post(url, data=_dumps(payload), headers=headers, timeout=60)
     response.raise_for_status()
-    return response.json()
+    return _loads(response.content)
+
+
+def _stream_post(endpoint: str, payload: Dict[str, Any], api_key: str) -> Iterator[Dict[str, Any]]:
+    """Perform a streaming POST request and yield each server-sent event.
+
+    The OpenAI-compatible API sends ``data: {...}`` lines terminated by a
+    ``data: [DONE]`` sentinel.  Each JSON event is parsed and yielded as it
+    arrives.  Errors are raised as in :func:`_post`.
+    """
+    if not api_key:
+        raise ValueError("An API key must be provided")
+    url = BASE_URL.rstrip("/") + endpoint
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    response = _SESSION.post(url, data=_dumps(payload), headers=headers, timeout=60, stream=True)
+    try:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:"):].strip()
+            if data == b"[DONE]":
+                break
+            yield _loads(data)
+    finally:
+        response.close()
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialise a request payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(content: bytes) -> Dict[str, Any]:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def chat_completion(messages: List[Dict[str, str]], api_key: str, model: str = "gpt-oss-120b") -> str:
@@ -87,12 +186,73 @@ def chat_completion(messages: List[Dict[str, str]], api_key: str, model: str = "
     return resp.get("choices", [{}])[0].get("message", {}).get("content", "")
 
 
+def chat_completion_stream(
+    messages: List[Dict[str, str]], api_key: str, model: str = "gpt-oss-120b"
+) -> Iterator[str]:
+    """Stream a chat completion, yielding pieces of the reply as they arrive.
+
+    This behaves like :func:`chat_completion` but requests a streamed
+    response, so callers can display the beginning of a long answer while
+    the rest is still being generated.
+
+    Parameters
+    ----------
+    messages: list of dict
+        Conversation messages following the OpenAI chat format.
+    api_key: str
+        Bearer token for authentication.
+    model: str, optional
+        Identifier of the model to use (default: gpt oss‑120b).
+
+    Yields
+    ------
+    str
+        Successive fragments of the assistant's reply.
+    """
+    payload = {"model": model, "messages": messages, "stream": True}
+    for event in _stream_post("/v1/chat/completions", payload, api_key):
+        content = (event.get("choices") or [{}])[0].get("delta", {}).get("content")
+        if content:
+            yield content
+
+
+def _cached_chat_completion(messages: List[Dict[str, str]], api_key: str, model: str) -> str:
+    """Call :func:`chat_completion`, reusing the reply for identical requests.
+
+    The cache key combines the serialised messages, the model and a SHA-256
+    digest of the API key, so the key itself is never stored.  Failed
+    requests raise as usual and are not cached.
+    """
+    key = (
+        json.dumps(messages, sort_keys=True),
+        hashlib.sha256((api_key or "").encode("utf-8")).hexdigest(),
+        model,
+    )
+    with _RESPONSE_CACHE_LOCK:
+        if key in _RESPONSE_CACHE:
+            _RESPONSE_CACHE.move_to_end(key)
+            return _RESPONSE_CACHE[key]
+    content = chat_completion(messages, api_key=api_key, model=model)
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = content
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    return content
+
+
+def _clear_response_cache() -> None:
+    """Drop all cached translation/summary responses."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
 def translate(text: str, api_key: str, model: str = "gpt-oss-120b") -> str:
     """Translate a Czech or multilingual text to English using the chat API.
 
     A system prompt instructs the model to perform translation without
-    embellishment.  If translation fails or the API is unreachable, an
-    exception will be raised.
+    embellishment.  Repeated requests for the same text and model are
+    answered from an in-memory cache.  If translation fails or the API is
+    unreachable, an exception will be raised.
 
     Parameters
     ----------
@@ -109,16 +269,18 @@ def translate(text: str, api_key: str, model: str = "gpt-oss-120b") -> str:
         The translated text.
     """
     messages = [
-        {"role": "system", "content": "You are an assistant that translates text to English. Translate the user message without adding new information."},
+        {"role": "system", "content": _TRANSLATE_PROMPT},
         {"role": "user", "content": text},
     ]
-    return chat_completion(messages, api_key=api_key, model=model)
+    return _cached_chat_completion(messages, api_key=api_key, model=model)
 
 
 def summarise(text: str, api_key: str, model: str = "gpt-oss-120b") -> str:
     """Generate a concise English summary of the provided text.
 
     The model is instructed via a system prompt to condense the content.
+    Repeated requests for the same text and model are answered from an
+    in-memory cache.
 
     Parameters
     ----------
@@ -135,15 +297,53 @@ def summarise(text: str, api_key: str, model: str = "gpt-oss-120b") -> str:
         The summary.
     """
     messages = [
-        {"role": "system", "content": "Summarise the following text in a concise and neutral manner."},
+        {"role": "system", "content": _SUMMARISE_PROMPT},
         {"role": "user", "content": text},
     ]
-    return chat_completion(messages, api_key=api_key, model=model)
+    return _cached_chat_completion(messages, api_key=api_key, model=model)
+
+
+def translate_and_summarise(text: str, api_key: str, model: str = "gpt-oss-120b") -> Tuple[str, str]:
+    """Translate and summarise the same text with two concurrent requests.
+
+    Both calls are network-bound and independent, so issuing them from a
+    small thread pool roughly halves the wall-clock time compared with
+    calling :func:`translate` and :func:`summarise` back to back.
+
+    Parameters
+    ----------
+    text: str
+        The input text to translate and summarise.
+    api_key: str
+        Bearer token for authentication.
+    model: str, optional
+        Model identifier (default: gpt oss‑120b).
+
+    Returns
+    -------
+    tuple of str
+        ``(translation, summary)``.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        translation = executor.submit(translate, text, api_key, model)
+        summary = executor.submit(summarise, text, api_key, model)
+        return translation.result(), summary.result()
 
 
-def embed(texts: List[str], api_key: str, model: str = "qwen3-embedding-4b") -> List[Dict[str, Any]]:
+def embed(
+    texts: List[str],
+    api_key: str,
+    model: str = "qwen3-embedding-4b",
+    batch_size: int = 64,
+    max_workers: int = 4,
+) -> List[Dict[str, Any]]:
     """Compute embeddings for a list of texts using an embedding model.
 
+    Large inputs are split into batches of ``batch_size`` texts which are
+    sent concurrently.  This keeps each request within the API's input
+    limits and overlaps the network latency of the individual batches.
+    Transient connection failures are retried by the shared session.
+
     Parameters
     ----------
     texts: list of str
@@ -151,13 +351,124 @@ def embed(texts: List[str], api_key: str, model: str = "qwen3-embedding-4b") ->
     api_key: str
         Bearer token for authentication.
     model: str, optional
-        Embedding model identifier (default: qwen3 embedding‑4b).
+        Embedding model identifier (default: qwen3 embedding‑4b).
+    batch_size: int, optional
+        Maximum number of texts per request (default: 64).
+    max_workers: int, optional
+        Maximum number of batches in flight at once (default: 4).
 
     Returns
     -------
     list of dict
-        Each dict contains an embedding vector and metadata as returned by the API.
+        Each dict contains an embedding vector and metadata as returned by the
+        API, in the same order as ``texts``.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    texts = list(texts)
+    chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)] or [texts]
+
+    def _embed_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+        resp = _post("/v1/embeddings", {"model": model, "input": chunk}, api_key)
+        return resp.get("data", [])
+
+    if len(chunks) == 1:
+        return _embed_chunk(chunks[0])
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        results = list(executor.map(_embed_chunk, chunks))
+    return [item for batch in results for item in batch]
+
+
+def _async_client() -> "httpx.AsyncClient":
+    """Create an ``httpx.AsyncClient`` for the API.
+
+    HTTP/2 is enabled when the ``h2`` package is installed, which lets
+    concurrent requests share a single multiplexed connection.  Connection
+    failures are retried by the transport.
+    """
+    if httpx is None:
+        raise ImportError(
+            "The async LLM helpers require httpx. Install via `pip install httpx`."
+        )
+    http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(http2=http2, retries=2)
+    return httpx.AsyncClient(transport=transport, timeout=60)
+
+
+async def _apost(
+    endpoint: str,
+    payload: Dict[str, Any],
+    api_key: str,
+    client: Optional["httpx.AsyncClient"] = None,
+) -> Dict[str, Any]:
+    """Asynchronous counterpart of :func:`_post`.
+
+    If ``client`` is omitted a short-lived client is created for the call;
+    pass a shared client to reuse its connections across requests.
+    """
+    if not api_key:
+        raise ValueError("An API key must be provided")
+    if client is None:
+        async with _async_client() as client:
+            return await _apost(endpoint, payload, api_key, client=client)
+    url = BASE_URL.rstrip("/") + endpoint
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    response = await client.post(url, content=_dumps(payload), headers=headers)
+    response.raise_for_status()
+    return _loads(response.content)
+
+
+async def achat_completion(
+    messages: List[Dict[str, str]],
+    api_key: str,
+    model: str = "gpt-oss-120b",
+    client: Optional["httpx.AsyncClient"] = None,
+) -> str:
+    """Asynchronous counterpart of :func:`chat_completion`."""
+    payload = {"model": model, "messages": messages}
+    resp = await _apost("/v1/chat/completions", payload, api_key, client=client)
+    return resp.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+
+async def atranslate(
+    text: str,
+    api_key: str,
+    model: str = "gpt-oss-120b",
+    client: Optional["httpx.AsyncClient"] = None,
+) -> str:
+    """Asynchronous counterpart of :func:`translate`."""
+    messages = [
+        {"role": "system", "content": _TRANSLATE_PROMPT},
+        {"role": "user", "content": text},
+    ]
+    return await achat_completion(messages, api_key=api_key, model=model, client=client)
+
+
+async def asummarise(
+    text: str,
+    api_key: str,
+    model: str = "gpt-oss-120b",
+    client: Optional["httpx.AsyncClient"] = None,
+) -> str:
+    """Asynchronous counterpart of :func:`summarise`."""
+    messages = [
+        {"role": "system", "content": _SUMMARISE_PROMPT},
+        {"role": "user", "content": text},
+    ]
+    return await achat_completion(messages, api_key=api_key, model=model, client=client)
+
+
+async def atranslate_and_summarise(
+    text: str, api_key: str, model: str = "gpt-oss-120b"
+) -> Tuple[str, str]:
+    """Asynchronous counterpart of :func:`translate_and_summarise`.
+
+    Both requests share one client and run concurrently, so with HTTP/2 they
+    are multiplexed over a single connection.
     """
-    payload = {"model": model, "input": texts}
-    resp = _post("/v1/embeddings", payload, api_key)
-    return resp.get("data", [])
+    async with _async_client() as client:
+        translation, summary = await asyncio.gather(
+            atranslate(text, api_key=api_key, model=model, client=client),
+            asummarise(text, api_key=api_key, model=model, client=client),
+        )
+    return translation, summary
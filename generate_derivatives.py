@@ -29,19 +29,44 @@ and educational purposes only.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List
 
 from rdkit import Chem
 from rdkit.Chem import rdChemReactions
 
 
+# Patterns are compiled once at import rather than on every call.
+# Terminal propyl fragment, written from the terminal methyl inwards so the
+# matcher anchors on the CH3 first; the terminal carbon is match[0].
+_TERMINAL_CHAIN_SMARTS = Chem.MolFromSmarts("[CH3][CH2][CH2]")
+# Terminal methyl (–CH3) to hydroxymethyl (–CH2OH).
+_HYDROXYL_RXN = rdChemReactions.ReactionFromSmarts("[CH3:1]>>[CH2:1]O")
+_HYDROXYL_RXN.Initialize()
+# Prototype carbon for chain growth; AddAtom copies it, so one instance is
+# shared by every call.
+_CARBON = Chem.Atom(6)
 
+
+
+@lru_cache(maxsize=4096)
 def _safe_mol_from_smiles(smiles: str) -> Chem.Mol | None:
+    # Memoised: propose_derivatives parses the same input once per
+    # transformation.  The returned molecule is shared and must not be
+    # modified in place (copy it into an RWMol first).
     mol = Chem.MolFromSmiles(smiles)
     return mol
 
 
 
+@lru_cache(maxsize=4096)
+def _symmetry_classes(smiles: str) -> tuple:
+    # Canonical atom ranks without tie-breaking: symmetry-equivalent atoms
+    # share a rank, memoised per SMILES
+    return tuple(Chem.CanonicalRankAtoms(_safe_mol_from_smiles(smiles), breakTies=False))
+
+
+
 def propose_chain_variants(smiles: str, delta: int = 1) -> List[str]:
     """Propose side‑chain length variants of a cannabinoid SMILES.
 
@@ -54,27 +79,31 @@ def propose_chain_variants(smiles: str, delta: int = 1) -> List[str]:
     mol = _safe_mol_from_smiles(smiles)
     if mol is None:
         return []
-    # Define a simple SMARTS pattern for a terminal carbon chain of length >=3
-    # pattern: carbon with at least two carbon neighbours and one hydrogen (alkyl)
-    pattern = Chem.MolFromSmarts("[CH2][CH2][CH3]")
-    matches = mol.GetSubstructMatches(pattern)
+    # Terminal carbon chain of length >=3 (see _TERMINAL_CHAIN_SMARTS)
+    matches = mol.GetSubstructMatches(_TERMINAL_CHAIN_SMARTS)
     if not matches:
         return [smiles]
     # For each match, attempt to modify the chain length
+    ranks = _symmetry_classes(smiles)
+    seen_ranks = set()
     variants = []
     for match in matches:
         # Identify the end atom (terminal carbon)
-        # match indices correspond to pattern atoms; choose the last carbon in pattern
-        end_idx = match[-1]
+        # match indices correspond to pattern atoms; the first is the terminal CH3
+        end_idx = match[0]
+        # Symmetry-equivalent chain ends yield the same variant; skip them
+        # before the comparatively expensive MolToSmiles call
+        if ranks[end_idx] in seen_ranks:
+            continue
+        seen_ranks.add(ranks[end_idx])
         chain_atom = mol.GetAtomWithIdx(end_idx)
         # Build a new molecule with adjusted chain
         rw_mol = Chem.RWMol(mol)
         # Expand or contract chain by adding/removing CH2 groups
         if delta > 0:
             for i in range(delta):
-                new_c = Chem.Atom("C")
-                new_idx = rw_mol.AddAtom(new_c)
-                rw_mol.AddBond(end_idx, new_idx, order=Chem.rdchem.BondType.SINGLE)
+                new_idx = rw_mol.AddAtom(_CARBON)
+                rw_mol.AddBond(end_idx, new_idx, Chem.BondType.SINGLE)
                 end_idx = new_idx
         elif delta < 0:
             for i in range(-delta):
@@ -97,15 +126,21 @@ def propose_hydroxylated(smiles: str) -> List[str]:
     terminal methyl group (–CH3) into an alcohol (–CH2OH).  If no such
     group is found, the original SMILES is returned.
     """
-    reaction_smarts = "[CH3:1]>>[CH2:1]O"
-    rxn = rdChemReactions.ReactionFromSmarts(reaction_smarts)
     mol = _safe_mol_from_smiles(smiles)
     if mol is None:
         return []
-    products = rxn.RunReactants((mol,))
+    products = _HYDROXYL_RXN.RunReactants((mol,))
+    ranks = _symmetry_classes(smiles)
+    seen_ranks = set()
     variants = []
     for prod_tuple in products:
         prod = prod_tuple[0]
+        # Product atom 0 is the mapped carbon; hydroxylating symmetry-equivalent
+        # methyls gives the same product, so only canonicalise the first one
+        rank = ranks[prod.GetAtomWithIdx(0).GetIntProp("react_atom_idx")]
+        if rank in seen_ranks:
+            continue
+        seen_ranks.add(rank)
         smi = Chem.MolToSmiles(prod, canonical=True)
         variants.append(smi)
     return list(set(variants)) or [smiles]
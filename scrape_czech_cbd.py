@@ -7,9 +7,9 @@ This module provides a small crawler for the Czech‑CBD e‑commerce site.
 The goal of the scraper is to extract high‑level information about novel
 cannabinoid products (e.g. 10‑OH‑HHC, THCV, THCO, HHC‑P, EPN, THCF) sold
 on ``https://www.czech-cbd.cz``.  It fetches product pages, parses their
-content and consolidates the results into a ``pandas.DataFrame``.  The
-resulting dataset can then be passed to downstream analysis routines in
-``rdkit_analysis.py``.
+content and yields the results as ``Product`` records, which ``main``
+streams to a CSV file.  The resulting dataset can then be passed to
+downstream analysis routines in ``rdkit_analysis.py``.
 
 **Implementation notes**
 -----------------------
@@ -20,8 +20,9 @@ resulting dataset can then be passed to downstream analysis routines in
   network access is permitted, it will gracefully fall back to ``requests``.
 
 * Parsing:  Product pages on Czech‑CBD are served as standard HTML.  We
-  use BeautifulSoup to extract the product name, price, description,
-  composition and active cannabinoids.  The parser is brittle; if the
+  use selectolax to extract the product name, price, description,
+  composition and active cannabinoids, falling back to BeautifulSoup
+  when selectolax is not installed.  The parser is brittle; if the
   site’s layout changes it may require adjustment.
 
 * Identification of cannabinoids:  The function ``identify_cannabinoids``
@@ -42,14 +43,17 @@ robots.txt when scraping.
 from __future__ import annotations
 
 import argparse
+import csv
 import logging
 import os
 import re
 import sys
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Iterable
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import partial
+from typing import Callable, List, Dict, Optional, Iterable, Iterator, Tuple
 
-import pandas as pd
 
 try:
     from bs4 import BeautifulSoup
@@ -60,14 +64,79 @@ except ImportError as e:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
 except ImportError as e:
     raise ImportError(
         "The requests library is required to run this script. Install via `pip install requests`."
     ) from e
 
+# selectolax (lexbor) is a much faster HTML parser for the handful of fields
+# we read; BeautifulSoup is used when it is not installed.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _HTMLParser
+    except ImportError:
+        _HTMLParser = None
+
+# lxml is considerably faster than the pure-Python parser; use it if present.
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Class names marking the product title and price.  Like the regexes used
+# with BeautifulSoup, the selectolax selectors match any class containing
+# one of them (e.g. "price-final-holder").
+_TITLE_CLASSES = ("product-detail-name", "page-title")
+_PRICE_CLASSES = ("price-final", "product-price")
+_TITLE_CLASS_RE = re.compile("|".join(_TITLE_CLASSES))
+_PRICE_CLASS_RE = re.compile("|".join(_PRICE_CLASSES))
+_TITLE_SELECTOR = ", ".join(f'h1[class*="{cls}"]' for cls in _TITLE_CLASSES)
+_PRICE_SELECTOR = ", ".join(f'[class*="{cls}"]' for cls in _PRICE_CLASSES)
+_COMPOSITION_RE = re.compile(r"(slo\u017een\u00ed|ingredients)", re.IGNORECASE)
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9-]")
+
+# Shared HTTP session: keeps connections to the shop alive between pages and
+# retries transient failures.  Sized for the thread pool in scrape_products.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+# Known cannabinoids, keyed by every spelling that is recognised and mapped
+# to the canonical (lower-case) name that is reported.  Spellings are written
+# as word tokens joined by "-"; text is split the same way before lookup, so
+# any run of hyphens (including the Unicode variants), spaces or punctuation
+# between the words matches.
+_CANNABINOID_VARIANTS = {
+    "10-oh-hhc": "10-oh-hhc",
+    "thcv": "thcv",
+    "thc-v": "thcv",
+    "thco": "thco",
+    "thc-o": "thco",
+    "hhc-p": "hhc-p",
+    "hhcp": "hhc-p",
+    "epn": "epn",
+    "thc-f": "thc-f",
+    "thcf": "thc-f",
+    "nl-1": "nl-1",
+}
+# Canonical names in reporting order
+_CANNABINOID_KEYWORDS = list(dict.fromkeys(_CANNABINOID_VARIANTS.values()))
+# Words a spelling can start with, and the longest spelling in words
+_KEYWORD_FIRST_TOKENS = frozenset(kw.split("-")[0] for kw in _CANNABINOID_VARIANTS)
+_MAX_KEYWORD_TOKENS = max(kw.count("-") + 1 for kw in _CANNABINOID_VARIANTS)
+# Runs of letters and digits (Unicode-aware, underscore excluded)
+_WORD_RE = re.compile(r"[^\W_]+")
+
 
 @dataclass
 class Product:
@@ -91,6 +160,10 @@ class Product:
         }
 
 
+# CSV header written by ``main``; matches the keys of ``Product.to_dict``.
+_CSV_FIELDS = [f.name for f in fields(Product)]
+
+
 def fetch_page(url: str, timeout: int = 15, headers: Optional[Dict[str, str]] = None, html_override: Optional[str] = None) -> str:
     """Fetch a page via HTTP and return its HTML content as a string.
 
@@ -127,7 +200,7 @@ def fetch_page(url: str, timeout: int = 15, headers: Optional[Dict[str, str]] =
     if headers:
         default_headers.update(headers)
     try:
-        response = requests.get(url, timeout=timeout, headers=default_headers)
+        response = _SESSION.get(url, timeout=timeout, headers=default_headers)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -146,56 +219,109 @@ def identify_cannabinoids(text: str) -> List[str]:
     Returns
     -------
     List[str]
-        A list of cannabinoid identifiers found in ``text``.  Matches are
-        case‑insensitive.
+        Canonical names of the cannabinoids found in ``text``.  Matching is
+        case‑insensitive and works on whole words, so spelling variants
+        such as "THC-O" and "THCO" are reported once, as ``"thco"``.
     """
     if not text:
         return []
-    text_lower = text.lower()
-    keywords = [
-        "10-oh-hhc",
-        "10‑oh‑hhc",
-        "10-oh hhc",
-        "thcv",
-        "thc-v",
-        "thco",
-        "thc-o",
-        "hhc-p",
-        "hhcp",
-        "epn",
-        "thc-f",
-        "thcf",
-        "nl-1",
-    ]
-    found = []
-    for kw in keywords:
-        if kw in text_lower:
-            # normalise hyphens and case
-            canonical = kw.replace("\u2011", "-").replace("\u2010", "-").lower()
-            if canonical not in found:
-                found.append(canonical)
-    return found
+    tokens = _WORD_RE.findall(unicodedata.normalize("NFKC", text).lower())
+    # Look up the runs of up to _MAX_KEYWORD_TOKENS words starting at each
+    # plausible first word, so overlapping names (e.g. "hhc-p" within
+    # "10-oh-hhc-p") are all found
+    found = set()
+    for i, token in enumerate(tokens):
+        if token not in _KEYWORD_FIRST_TOKENS:
+            continue
+        for j in range(i + 1, min(i + _MAX_KEYWORD_TOKENS, len(tokens)) + 1):
+            name = _CANNABINOID_VARIANTS.get("-".join(tokens[i:j]))
+            if name is not None:
+                found.add(name)
+    # Report matches in keyword order for stable output
+    return [kw for kw in _CANNABINOID_KEYWORDS if kw in found]
 
 
-def parse_product_page(html: str, url: str) -> Optional[Product]:
-    """Parse a product page to extract fields of interest.
+def _extract_fields_selectolax(html: str) -> Optional[Tuple[Optional[str], Optional[str], str, str]]:
+    """Extract ``(name, price, description, composition)`` using selectolax.
 
-    Parameters
-    ----------
-    html: str
-        The HTML content of the product page.
-    url: str
-        The URL of the product page (for reference in the Product record).
+    Mirrors :func:`_extract_fields_bs4`.  Returns None if selectolax is not
+    installed or the page could not be parsed, in which case the caller falls
+    back to BeautifulSoup.
+    """
+    if _HTMLParser is None:
+        return None
+    try:
+        tree = _HTMLParser(html)
+    except Exception:
+        return None
+    # Extract product name
+    name = None
+    title_node = tree.css_first(_TITLE_SELECTOR)
+    if title_node is None:
+        # Fallback: use the page title
+        title_node = tree.css_first("title")
+    if title_node is not None:
+        name = title_node.text(strip=True)
+    if not name:
+        return None
 
-    Returns
-    -------
-    Product or None
-        A ``Product`` instance containing the parsed data, or None if
-        parsing failed.
+    # Extract price
+    price = None
+    price_node = tree.css_first(_PRICE_SELECTOR)
+    if price_node is not None:
+        price = price_node.text(strip=True)
+
+    # Extract description and composition (same rules as the bs4 path)
+    composition = ""
+    parts: List[str] = []
+    desc_node = tree.css_first('[itemprop="description"]')
+    if desc_node is not None:
+        # Like BeautifulSoup's get_text, leave out script and style contents
+        strings = (
+            n.text(deep=False).strip()
+            for n in desc_node.traverse(include_text=True)
+            if n.tag == "-text" and n.parent.tag not in ("script", "style")
+        )
+        parts.append("\n".join(t for t in strings if t))
+    container = desc_node if desc_node is not None else tree
+    for sec in container.css("p, div"):
+        # Unlike BeautifulSoup's select, css() also matches the container
+        if sec == desc_node:
+            continue
+        string = _node_string(sec)
+        if string is None:
+            continue
+        text = string.strip()
+        if not composition and _COMPOSITION_RE.search(text):
+            composition = text
+        if desc_node is None:
+            parts.append(text)
+    return name, price, "\n".join(parts), composition
+
+
+def _node_string(node) -> Optional[str]:
+    """selectolax equivalent of BeautifulSoup's ``Tag.string``.
+
+    Returns the text of a node whose only child is a text node, descending
+    through single-child elements; otherwise None.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    children = list(node.iter(include_text=True))
+    if len(children) != 1:
+        return None
+    child = children[0]
+    if child.tag == "-text":
+        return child.text(deep=False)
+    if child.tag.startswith("-"):
+        # Comments and other non-element nodes
+        return None
+    return _node_string(child)
+
+
+def _extract_fields_bs4(html: str) -> Tuple[Optional[str], Optional[str], str, str]:
+    """Extract ``(name, price, description, composition)`` using BeautifulSoup."""
+    soup = BeautifulSoup(html, _BS_PARSER)
     # Extract product name
-    title_tag = soup.find("h1", class_=re.compile("product-detail-name|page-title"))
+    title_tag = soup.find("h1", class_=_TITLE_CLASS_RE)
     name = None
     if title_tag:
         name = title_tag.get_text(strip=True)
@@ -204,30 +330,63 @@ def parse_product_page(html: str, url: str) -> Optional[Product]:
         if soup.title:
             name = soup.title.get_text(strip=True)
     if not name:
-        logger.warning("Could not find product name on %s", url)
-        return None
+        return None, None, "", ""
 
     # Extract price
     price = None
-    price_tag = soup.find(class_=re.compile("price-final|product-price"))
+    price_tag = soup.find(class_=_PRICE_CLASS_RE)
     if price_tag:
         price = price_tag.get_text(strip=True)
 
     # Extract description and composition
-    description = ""
     composition = ""
-    # Many product pages embed description in a div with itemprop="description"
-    desc_tag = soup.find(attrs={"itemprop": "description"})
+    parts: List[str] = []
+    # Many product pages embed description in a div with itemprop="description".
+    # When present, only that block is searched instead of the whole page.
+    desc_tag = soup.select_one('[itemprop="description"]')
     if desc_tag:
-        description = desc_tag.get_text(separator="\n", strip=True)
+        parts.append(desc_tag.get_text(separator="\n", strip=True))
+    container = desc_tag or soup
     # Look for composition or ingredients sections
     # Search for paragraphs containing keywords
-    sections = soup.find_all(["p", "div"], string=True)
-    for sec in sections:
+    for sec in container.select("p, div"):
+        if sec.string is None:
+            continue
         text = sec.get_text(strip=True)
-        if not composition and re.search(r"(slo\u017een\u00ed|ingredients)", text, re.IGNORECASE):
+        if not composition and _COMPOSITION_RE.search(text):
             composition = text
-        description += "\n" + text
+        if desc_tag is None:
+            # Without a description block, collect the page's text paragraphs
+            parts.append(text)
+    return name, price, "\n".join(parts), composition
+
+
+def parse_product_page(html: str, url: str) -> Optional[Product]:
+    """Parse a product page to extract fields of interest.
+
+    The fast selectolax parser is used when installed; BeautifulSoup is the
+    fallback, and is also used for pages selectolax cannot make sense of.
+
+    Parameters
+    ----------
+    html: str
+        The HTML content of the product page.
+    url: str
+        The URL of the product page (for reference in the Product record).
+
+    Returns
+    -------
+    Product or None
+        A ``Product`` instance containing the parsed data, or None if
+        parsing failed.
+    """
+    extracted = _extract_fields_selectolax(html)
+    if extracted is None:
+        extracted = _extract_fields_bs4(html)
+    name, price, description, composition = extracted
+    if not name:
+        logger.warning("Could not find product name on %s", url)
+        return None
 
     cannabinoids = identify_cannabinoids(description + " " + composition)
     return Product(
@@ -240,8 +399,40 @@ def parse_product_page(html: str, url: str) -> Optional[Product]:
     )
 
 
-def scrape_products(urls: Iterable[str], html_dir: Optional[str] = None) -> List[Product]:
-    """Scrape multiple product URLs and return a list of ``Product`` instances.
+def _scrape_one(url: str, html_dir: Optional[str] = None) -> Optional[Product]:
+    """Fetch and parse a single product page; returns None on failure."""
+    html = None
+    if html_dir:
+        # Determine filename by stripping scheme and non‑filename characters
+        slug = _SLUG_RE.sub("-", url.split("/")[-1])
+        path = os.path.join(html_dir, slug + ".html")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                html = f.read()
+    logger.info("Fetching %s", url)
+    page = fetch_page(url, html_override=html)
+    if not page:
+        logger.warning("Skipping %s due to fetch failure", url)
+        return None
+    product = parse_product_page(page, url)
+    if not product:
+        logger.warning("Failed to parse product page: %s", url)
+    return product
+
+
+def scrape_products(
+    urls: Iterable[str],
+    html_dir: Optional[str] = None,
+    max_workers: int = 8,
+    progress: Optional[Callable[[], None]] = None,
+) -> Iterator[Product]:
+    """Scrape multiple product URLs and yield ``Product`` instances.
+
+    Pages are fetched and parsed concurrently by a pool of ``max_workers``
+    threads sharing one keep-alive HTTP session, so total time is bounded by
+    the slowest pages rather than the sum of all request latencies.  Products
+    are yielded as soon as they are parsed, so callers can process them
+    without holding the whole crawl in memory.
 
     Parameters
     ----------
@@ -251,34 +442,26 @@ def scrape_products(urls: Iterable[str], html_dir: Optional[str] = None) -> List
         If provided, a directory path containing pre‑saved HTML files.  Each
         filename should match the slug of the URL (e.g., ``thc-f-vape.html``)
         and will be used instead of performing network requests.
-
-    Returns
-    -------
-    List[Product]
-        A list of successfully parsed products.  Any pages that could not
-        be fetched or parsed will be skipped with a warning.
+    max_workers: int
+        Maximum number of pages fetched at the same time.
+    progress: callable or None
+        If provided, called with no arguments once per URL, including pages
+        that were skipped, as its result is taken in the order of ``urls``.
+        It runs in the caller's thread.
+
+    Yields
+    ------
+    Product
+        Successfully parsed products, in the order of ``urls``.  Any pages
+        that could not be fetched or parsed will be skipped with a warning.
     """
-    products: List[Product] = []
-    for url in urls:
-        html = None
-        if html_dir:
-            # Determine filename by stripping scheme and non‑filename characters
-            slug = re.sub(r"[^a-zA-Z0-9-]", "-", url.split("/")[-1])
-            path = os.path.join(html_dir, slug + ".html")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    html = f.read()
-        logger.info("Fetching %s", url)
-        page = fetch_page(url, html_override=html)
-        if not page:
-            logger.warning("Skipping %s due to fetch failure", url)
-            continue
-        product = parse_product_page(page, url)
-        if product:
-            products.append(product)
-        else:
-            logger.warning("Failed to parse product page: %s", url)
-    return products
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(partial(_scrape_one, html_dir=html_dir), urls)
+        for product in results:
+            if progress is not None:
+                progress()
+            if product is not None:
+                yield product
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -320,12 +503,21 @@ def main(argv: Optional[List[str]] = None) -> int:
     ]
     urls = args.urls if args.urls else default_urls
     products = scrape_products(urls, html_dir=args.html_dir)
-    if not products:
+    # Only create the output file once there is something to write
+    first = next(products, None)
+    if first is None:
         logger.error("No products were scraped. Exiting.")
         return 1
-    df = pd.DataFrame([p.to_dict() for p in products])
-    df.to_csv(args.output, index=False)
-    logger.info("Wrote %d products to %s", len(products), args.output)
+    # Rows are written as they are scraped rather than collected first
+    with open(args.output, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=_CSV_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(first.to_dict())
+        count = 1
+        for product in products:
+            writer.writerow(product.to_dict())
+            count += 1
+    logger.info("Wrote %d products to %s", count, args.output)
     return 0
 
 
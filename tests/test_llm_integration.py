@@ -1,7 +1,15 @@
+import asyncio
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 
-from czech_cbd_analysis.llm_integration import _post, chat_completion, translate, summarise, embed
+from czech_cbd_analysis import llm_integration
+from czech_cbd_analysis.llm_integration import _SESSION, _clear_response_cache, _post, chat_completion, chat_completion_stream, translate, summarise, translate_and_summarise, embed
+
+
+def _response(payload):
+    """Build a mocked HTTP response whose body is ``payload`` as JSON."""
+    return MagicMock(status_code=200, content=json.dumps(payload).encode("utf-8"))
 
 
 class TestLLMIntegration(unittest.TestCase):
@@ -9,38 +17,136 @@ class TestLLMIntegration(unittest.TestCase):
 
     def setUp(self) -> None:
         self.api_key = "test-key"
+        _clear_response_cache()
 
-    @patch("czech_cbd_analysis.llm_integration.requests.post")
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
     def test_chat_completion(self, mock_post):
         """chat_completion should return the content of the first choice."""
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: {"choices": [{"message": {"content": "Hello"}}]})
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Hello"}}]})
         result = chat_completion([{"role": "user", "content": "Hi"}], api_key=self.api_key)
         self.assertEqual(result, "Hello")
         mock_post.assert_called_once()
 
-    @patch("czech_cbd_analysis.llm_integration.requests.post")
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_chat_completion_stream(self, mock_post):
+        """chat_completion_stream should yield content deltas until [DONE]."""
+        events = [{"choices": [{"delta": {"role": "assistant"}}]}] + [
+            {"choices": [{"delta": {"content": piece}}]} for piece in ("Hel", "lo")
+        ]
+        lines = [b"data: " + json.dumps(e).encode("utf-8") for e in events] + [b"", b"data: [DONE]"]
+        mock_post.return_value = MagicMock(status_code=200, iter_lines=lambda: iter(lines))
+        result = list(chat_completion_stream([{"role": "user", "content": "Hi"}], api_key=self.api_key))
+        self.assertEqual(result, ["Hel", "lo"])
+        self.assertTrue(json.loads(mock_post.call_args.kwargs["data"])["stream"])
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
     def test_translate(self, mock_post):
         """translate should pass a system prompt and return the translated text."""
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: {"choices": [{"message": {"content": "Hello"}}]})
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Hello"}}]})
         result = translate("Ahoj", api_key=self.api_key)
         self.assertEqual(result, "Hello")
 
-    @patch("czech_cbd_analysis.llm_integration.requests.post")
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_translate_cached(self, mock_post):
+        """Repeated identical translations should only hit the API once."""
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Hello"}}]})
+        self.assertEqual(translate("Ahoj", api_key=self.api_key), "Hello")
+        self.assertEqual(translate("Ahoj", api_key=self.api_key), "Hello")
+        mock_post.assert_called_once()
+        translate("Ahoj", api_key=self.api_key, model="other-model")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
     def test_summarise(self, mock_post):
         """summarise should produce a concise summary."""
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: {"choices": [{"message": {"content": "Summary"}}]})
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Summary"}}]})
         result = summarise("Long text", api_key=self.api_key)
         self.assertEqual(result, "Summary")
 
-    @patch("czech_cbd_analysis.llm_integration.requests.post")
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_translate_and_summarise(self, mock_post):
+        """translate_and_summarise should return both results in order."""
+        def fake_post(url, data, headers, timeout):
+            system_prompt = json.loads(data)["messages"][0]["content"]
+            content = "Hello" if system_prompt.startswith("You are an assistant that translates") else "Summary"
+            return _response({"choices": [{"message": {"content": content}}]})
+
+        mock_post.side_effect = fake_post
+        translation, summary = translate_and_summarise("Ahoj", api_key=self.api_key)
+        self.assertEqual((translation, summary), ("Hello", "Summary"))
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
     def test_embed(self, mock_post):
         """embed should return a list of embeddings."""
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: {"data": [{"embedding": [0.1, 0.2], "text": "test"}]})
+        mock_post.return_value = _response({"data": [{"embedding": [0.1, 0.2], "text": "test"}]})
         result = embed(["test"], api_key=self.api_key)
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 1)
         self.assertIn("embedding", result[0])
 
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_post_reuses_session(self, mock_post):
+        """Consecutive calls should go through the shared pooled session."""
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Hi"}}]})
+        translate("Ahoj", api_key=self.api_key)
+        summarise("Ahoj", api_key=self.api_key)
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args.kwargs["headers"]["Authorization"], "Bearer test-key")
+        adapter = _SESSION.get_adapter(llm_integration.BASE_URL)
+        self.assertIs(adapter.max_retries, llm_integration._RETRY)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertIs(_SESSION.get_adapter("http://localhost:8000/api/"), adapter)
+
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_embed_batches(self, mock_post):
+        """embed should split large inputs into batches and keep input order."""
+        def fake_post(url, data, headers, timeout):
+            texts = json.loads(data)["input"]
+            return _response({"data": [{"embedding": [0.0], "text": t} for t in texts]})
+
+        mock_post.side_effect = fake_post
+        texts = [f"text {i}" for i in range(5)]
+        result = embed(texts, api_key=self.api_key, batch_size=2)
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual([item["text"] for item in result], texts)
+
+    @patch("czech_cbd_analysis.llm_integration.orjson", None)
+    @patch("czech_cbd_analysis.llm_integration._SESSION.post")
+    def test_post_without_orjson(self, mock_post):
+        """_post should fall back to the standard json module."""
+        mock_post.return_value = _response({"choices": [{"message": {"content": "Dobrý den"}}]})
+        result = chat_completion([{"role": "user", "content": "Přeložte"}], api_key=self.api_key)
+        self.assertEqual(result, "Dobrý den")
+        sent = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(sent["messages"][0]["content"], "Přeložte")
+
+    def test_session_retries_post(self):
+        """The shared session should retry transient errors on POST."""
+        retries = _SESSION.get_adapter("https://chat.ai.e-infra.cz/api/").max_retries
+        self.assertIn("POST", retries.allowed_methods)
+        self.assertIn(429, retries.status_forcelist)
+        self.assertIn(503, retries.status_forcelist)
+
+    @unittest.skipIf(llm_integration.httpx is None, "httpx is not installed")
+    def test_atranslate_and_summarise(self):
+        """The async helpers should issue both requests and return results in order."""
+        httpx = llm_integration.httpx
+        seen = []
+
+        def handler(request):
+            system_prompt = json.loads(request.content)["messages"][0]["content"]
+            seen.append(request.headers["Authorization"])
+            content = "Hello" if system_prompt.startswith("You are an assistant that translates") else "Summary"
+            return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+        transport = httpx.MockTransport(handler)
+        with patch.object(llm_integration, "_async_client", lambda: httpx.AsyncClient(transport=transport)):
+            result = asyncio.run(llm_integration.atranslate_and_summarise("Ahoj", api_key=self.api_key))
+        self.assertEqual(result, ("Hello", "Summary"))
+        self.assertEqual(seen, ["Bearer test-key"] * 2)
+
     def test_post_no_api_key(self):
         """_post should raise ValueError when api_key is empty."""
         with self.assertRaises(ValueError):
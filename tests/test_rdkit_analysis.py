@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import rdkit_analysis
+from rdkit_analysis import analyse_multiple, analyse_smiles, analyse_smiles_file
+
+
+THC = "CCCCCc1cc(O)c2c(c1)OC(C)(C)C1CCC(C)=CC21"
+
+
+class TestAnalyseSmiles(unittest.TestCase):
+    """Test suite for the optional work in analyse_smiles."""
+
+    def test_optional_qed_and_admet(self):
+        """Disabled calculations should be stored as None."""
+        result = analyse_smiles(THC, compute_qed=False, compute_admet=False)
+        self.assertIsNone(result.qed_score)
+        self.assertIsNone(result.admet_predictions)
+        self.assertEqual(result.descriptors, analyse_smiles(THC).descriptors)
+
+    def test_lenient_matches_strict(self):
+        """strict=False should give the same results for valid molecules."""
+        strict = analyse_smiles(THC)
+        lenient = analyse_smiles(THC, strict=False)
+        self.assertEqual(lenient.descriptors, strict.descriptors)
+        self.assertEqual(lenient.qed_score, strict.qed_score)
+
+    def test_lenient_rejects_invalid(self):
+        """strict=False should reject the SMILES full sanitization rejects."""
+        for smiles in ("c1cccc1", "C(C)(C)(C)(C)C"):
+            with self.assertRaises(ValueError):
+                analyse_smiles(smiles, strict=False)
+            with self.assertRaises(ValueError):
+                analyse_smiles(smiles, strict=False, compute_qed=False)
+
+    def test_svg_depiction(self):
+        """Depictions should be saved as SVG by default."""
+        with tempfile.TemporaryDirectory() as tmp:
+            result = analyse_smiles("CCO", image_dir=os.path.join(tmp, "images"))
+            self.assertTrue(result.image_path.endswith(".svg"))
+            with open(result.image_path, encoding="utf-8") as fh:
+                self.assertIn("<svg", fh.read())
+
+
+class TestAnalyseMultiple(unittest.TestCase):
+    """Test suite for the DataFrame returned by analyse_multiple."""
+
+    def test_process_pool_keeps_order(self):
+        """The worker pool should return the serial rows in input order."""
+        smiles = ["C" * n + "O" for n in range(1, 30)] + ["not a smiles", THC]
+        serial = analyse_multiple(smiles, n_jobs=1)
+        parallel = analyse_multiple(smiles, n_jobs=2, chunksize=4)
+        self.assertEqual(parallel["SMILES"].tolist(), smiles[:29] + [THC])
+        self.assertTrue(parallel.equals(serial))
+
+    def test_column_dtypes(self):
+        """Columns should be typed and invalid SMILES skipped."""
+        df = analyse_multiple(["CCO", "not a smiles", THC], n_jobs=1)
+        self.assertEqual(df["SMILES"].tolist(), ["CCO", THC])
+        self.assertEqual(df["MolWt"].dtype, np.float32)
+        self.assertEqual(df["QED"].dtype, np.float32)
+        self.assertEqual(df["Lipinski_Pass"].dtype, bool)
+        self.assertIsInstance(df["ADMET_Toxicity"].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(df["ADMET_Toxicity"].cat.categories), ["low", "moderate", "high"])
+
+    def test_skipped_columns(self):
+        """Disabled calculations should leave their columns out."""
+        df = analyse_multiple(["CCO"], n_jobs=1, compute_qed=False, compute_admet=False)
+        self.assertNotIn("QED", df.columns)
+        self.assertFalse(any(col.startswith("ADMET_") for col in df.columns))
+        self.assertIn("Lipinski_Pass", df.columns)
+
+    def test_descriptor_failure_skips_row(self):
+        """A molecule whose descriptors fail should be left out."""
+        def fail_on_thc(mol):
+            if mol.GetNumAtoms() > 3:
+                raise RuntimeError("descriptor failed")
+            return 0
+        rdkit_analysis._cached_descriptors.cache_clear()
+        self.addCleanup(rdkit_analysis._cached_descriptors.cache_clear)
+        with patch.object(rdkit_analysis, "_DESCRIPTORS", rdkit_analysis._DESCRIPTORS + [("Fail", fail_on_thc)]):
+            df = analyse_multiple(["CCO", THC], n_jobs=1)
+        self.assertEqual(df["SMILES"].tolist(), ["CCO"])
+
+    def test_empty(self):
+        """No valid molecules should give an empty DataFrame."""
+        self.assertTrue(analyse_multiple(["not a smiles"], n_jobs=1).empty)
+
+
+class TestAnalyseSmilesFile(unittest.TestCase):
+    """Test suite for analyse_smiles_file."""
+
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as fh:
+            fh.write(f"name,smiles\nethanol,CCO\nblank,\nthc,{THC}\n")
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_reads_smiles_column(self):
+        """Non-empty cells of the SMILES column should be analysed in order."""
+        df = analyse_smiles_file(self.path, n_jobs=1)
+        self.assertEqual(df["SMILES"].tolist(), ["CCO", THC])
+
+    def test_missing_column(self):
+        """A missing SMILES column should raise ValueError."""
+        with self.assertRaises(ValueError):
+            analyse_smiles_file(self.path, smiles_column="smi")
+
+
+if __name__ == "__main__":
+    unittest.main()
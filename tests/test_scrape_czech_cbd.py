@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import patch
+
+import scrape_czech_cbd
+from scrape_czech_cbd import identify_cannabinoids, parse_product_page
+
+
+_PAGE = """
+<html>
+  <head><title>Czech-CBD</title></head>
+  <body>
+    <h1 class="product-detail-name">THC-O Cookies</h1>
+    <span class="price-final">299 Kč</span>
+    <div itemprop="description">
+      <p>Sušenky s THC‑O a HHCP.</p>
+      <script>var a = 1;</script>
+      <p>Složení: mouka, cukr, THC-O</p>
+    </div>
+    <div class="tab">Ingredients: EPN</div>
+  </body>
+</html>
+"""
+
+
+class TestIdentifyCannabinoids(unittest.TestCase):
+    """Test suite for keyword matching in identify_cannabinoids."""
+
+    def test_variants_collapse_to_canonical_names(self):
+        """Spelling variants should be reported once, under the canonical name."""
+        self.assertEqual(identify_cannabinoids("THC-O, thco"), ["thco"])
+        self.assertEqual(identify_cannabinoids("HHCP"), ["hhc-p"])
+        self.assertEqual(identify_cannabinoids("THCV / THC-V"), ["thcv"])
+
+    def test_separators_and_unicode_hyphens(self):
+        """Any separator between the words of a name should match."""
+        self.assertEqual(identify_cannabinoids("10‑OH‑HHC"), ["10-oh-hhc"])
+        self.assertEqual(identify_cannabinoids("10-OH HHC"), ["10-oh-hhc"])
+        self.assertEqual(identify_cannabinoids("NL 1"), ["nl-1"])
+
+    def test_overlapping_names_and_order(self):
+        """Overlapping names are all found and reported in keyword order."""
+        self.assertEqual(identify_cannabinoids("EPN a 10-OH-HHC-P"), ["10-oh-hhc", "hhc-p", "epn"])
+
+    def test_whole_words_only(self):
+        """Names embedded in longer words should not match."""
+        self.assertEqual(identify_cannabinoids("thcvape"), [])
+        self.assertEqual(identify_cannabinoids(""), [])
+
+
+class TestParseProductPage(unittest.TestCase):
+    """Test suite for parse_product_page on both HTML parsers."""
+
+    def _check_product(self, product):
+        self.assertIsNotNone(product)
+        self.assertEqual(product.name, "THC-O Cookies")
+        self.assertEqual(product.url, "https://example.cz/thc-o-cookies")
+        self.assertEqual(product.price, "299 Kč")
+        # Only the description block is used; scripts and other tabs are ignored
+        self.assertEqual(product.description, "Sušenky s THC‑O a HHCP.\nSložení: mouka, cukr, THC-O")
+        self.assertEqual(product.composition, "Složení: mouka, cukr, THC-O")
+        self.assertEqual(product.cannabinoids, ["thco", "hhc-p"])
+
+    @unittest.skipIf(scrape_czech_cbd._HTMLParser is None, "selectolax not installed")
+    def test_selectolax_path(self):
+        """The selectolax extractor should handle the page."""
+        self.assertIsNotNone(scrape_czech_cbd._extract_fields_selectolax(_PAGE))
+        self._check_product(parse_product_page(_PAGE, "https://example.cz/thc-o-cookies"))
+
+    def test_bs4_path(self):
+        """Without selectolax, BeautifulSoup should produce the same record."""
+        with patch.object(scrape_czech_cbd, "_HTMLParser", None):
+            self._check_product(parse_product_page(_PAGE, "https://example.cz/thc-o-cookies"))
+
+    @unittest.skipIf(scrape_czech_cbd._HTMLParser is None, "selectolax not installed")
+    def test_partial_class_names(self):
+        """Title and price classes should match as substrings on both paths."""
+        html = (
+            "<html><head><title>Shop</title></head><body>"
+            '<h1 class="product-detail-name-x">THC-O Cookies</h1>'
+            '<strong class="price-final-holder">299 Kč</strong>'
+            "</body></html>"
+        )
+        expected = ("THC-O Cookies", "299 Kč")
+        self.assertEqual(scrape_czech_cbd._extract_fields_selectolax(html)[:2], expected)
+        self.assertEqual(scrape_czech_cbd._extract_fields_bs4(html)[:2], expected)
+
+    @unittest.skipIf(scrape_czech_cbd._HTMLParser is None, "selectolax not installed")
+    def test_parser_parity(self):
+        """Both extractors should return the same fields."""
+        pages = [
+            _PAGE,
+            '<html><body><h1 class="page-title">X</h1>'
+            '<div itemprop="description">Ingredients: EPN</div></body></html>',
+            '<html><body><h1 class="page-title">X</h1><p>Složení: HHC</p><div>EPN</div></body></html>',
+        ]
+        for html in pages:
+            self.assertEqual(
+                scrape_czech_cbd._extract_fields_selectolax(html),
+                scrape_czech_cbd._extract_fields_bs4(html),
+            )
+
+    def test_missing_name(self):
+        """Pages without a product name should be rejected."""
+        html = "<html><body><p>THC-O</p></body></html>"
+        self.assertIsNone(parse_product_page(html, "https://example.cz/empty"))
+        with patch.object(scrape_czech_cbd, "_HTMLParser", None):
+            self.assertIsNone(parse_product_page(html, "https://example.cz/empty"))
+
+
+class TestScrapeProducts(unittest.TestCase):
+    """Test suite for scrape_products."""
+
+    def test_order_and_progress(self):
+        """Products keep URL order and progress counts skipped pages too."""
+        def fake_scrape_one(url, html_dir=None):
+            return None if url.endswith("bad") else scrape_czech_cbd.Product(name=url, url=url)
+
+        urls = [f"https://example.cz/{i}" for i in range(20)] + ["https://example.cz/bad"]
+        calls = []
+        with patch.object(scrape_czech_cbd, "_scrape_one", fake_scrape_one):
+            products = list(scrape_czech_cbd.scrape_products(urls, max_workers=4, progress=lambda: calls.append(1)))
+        self.assertEqual([p.url for p in products], urls[:-1])
+        self.assertEqual(len(calls), len(urls))
+
+
+if __name__ == "__main__":
+    unittest.main()